@@ -78,8 +78,11 @@ def abs_file_paths(xs, base_dir=None, ignore_keys=None, fileonly_keys=None, cur_
     fileonly_keys -- algorithm key names to only expand files (not directories)
     cur_key -- current key when calling recursively
     """
-    ignore_keys = set([]) if ignore_keys is None else set(ignore_keys)
-    fileonly_keys = set([]) if fileonly_keys is None else set(fileonly_keys)
+    # callers pass frozensets which also flow through recursive calls unchanged
+    if not isinstance(ignore_keys, (set, frozenset)):
+        ignore_keys = frozenset() if ignore_keys is None else frozenset(ignore_keys)
+    if not isinstance(fileonly_keys, (set, frozenset)):
+        fileonly_keys = frozenset() if fileonly_keys is None else frozenset(fileonly_keys)
     if base_dir is None:
         base_dir = os.getcwd()
     orig_dir = os.getcwd()
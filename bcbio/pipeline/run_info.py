@@ -5,16 +5,28 @@ next gen LIMS system or an on-file YAML configuration.
 """
 import collections
 from contextlib import closing
+try:
+    from concurrent import futures
+except ImportError:
+    futures = None
 import copy
-import glob
+import functools
 import itertools
-import operator
 import os
+import pickle
 import string
 import sys
 
+import numpy as np
 import six
-import toolz as tz
+try:  # C implementation of the toolz traversals, when available
+    import cytoolz as tz
+except ImportError:
+    import toolz as tz
+try:  # activates libyaml bindings for plain `import yaml` users, when installed
+    import pylibyaml
+except ImportError:
+    pylibyaml = None
 import yaml
 from bcbio import install, utils, structural
 from bcbio.bam import fastq, ref
@@ -30,20 +42,98 @@ from bcbio.qc import viral
 from bcbio.variation import annotation, effects, genotype, population, joint, vcfutils, vcfanno
 from bcbio.variation.cortex import get_sample_name
 from bcbio.bam.fastq import open_fastq
-from functools import reduce
+
+# libyaml-backed loader avoids the slow pure Python parse loop when available
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _yload(stream):
+    """Load YAML using the C-accelerated parser when PyYAML has libyaml support.
+    """
+    return yaml.load(stream, Loader=Loader)
 
 ALLOWED_CONTIG_NAME_CHARS = set(list(string.digits) + list(string.ascii_letters) + ["-", "_", "*", ":", "."])
-ALGORITHM_NOPATH_KEYS = ["variantcaller", "realign", "recalibrate", "peakcaller",
-                         "expression_caller", "singlecell_quantifier",
-                         "fusion_caller",
-                         "svcaller", "hetcaller", "jointcaller", "tools_off", "tools_on",
-                         "mixup_check", "qc", "transcript_assembler"]
-ALGORITHM_FILEONLY_KEYS = ["custom_trim", "vcfanno"]
+# deletes allowed characters, leaving only the problem ones behind
+_CONTIG_NAME_DEL_TABLE = str.maketrans("", "", "".join(sorted(ALLOWED_CONTIG_NAME_CHARS)))
+ALGORITHM_NOPATH_KEYS = frozenset(["variantcaller", "realign", "recalibrate", "peakcaller",
+                                   "expression_caller", "singlecell_quantifier",
+                                   "fusion_caller",
+                                   "svcaller", "hetcaller", "jointcaller", "tools_off", "tools_on",
+                                   "mixup_check", "qc", "transcript_assembler"])
+ALGORITHM_FILEONLY_KEYS = frozenset(["custom_trim", "vcfanno"])
 # these analysis pipelines use R heavily downstream, and need to have samplenames
 # cleaned up to conform to R specifications
 R_DOWNSTREAM_ANALYSIS = ["rna-seq", "fastrna-seq", "scrna-seq", "chip-seq",
                          "scrna-seq"]
 
+def _get_bcbio_version():
+    try:
+        from bcbio.pipeline import version
+        return getattr(version, "__version__", "")
+    except ImportError:
+        return ""
+
+def _run_info_cache_key(run_info_yaml):
+    return (os.path.getmtime(run_info_yaml), os.path.getsize(run_info_yaml),
+            _get_bcbio_version())
+
+def _read_run_info_cache(run_info_yaml):
+    """Retrieve organized run information from a pickle sidecar, if still valid.
+
+    Opt-in with BCBIO_RUNINFO_CACHE=1, avoiding re-parsing and re-validation of
+    unchanged sample YAMLs on pipeline restarts.
+    """
+    cache_file = run_info_yaml + ".bcbio_cache.pkl"
+    if not utils.file_exists(cache_file):
+        return None
+    try:
+        with open(cache_file, "rb") as in_handle:
+            cached = pickle.load(in_handle)
+    except Exception:
+        return None
+    if isinstance(cached, dict) and cached.get("key") == _run_info_cache_key(run_info_yaml):
+        return cached.get("items")
+
+def _write_run_info_cache(run_info_yaml, items):
+    cache_file = run_info_yaml + ".bcbio_cache.pkl"
+    try:
+        with open(cache_file, "wb") as out_handle:
+            pickle.dump({"key": _run_info_cache_key(run_info_yaml), "items": items},
+                        out_handle, protocol=pickle.HIGHEST_PROTOCOL)
+    except (IOError, OSError):
+        pass
+
+def _organize_item(item, dirs, config, remote_retriever, integrations, ref_cache):
+    """Finalize a single sample: configuration, reference resources, tmp setup.
+
+    Safe to run concurrently across items; the shared ref_cache only sees
+    atomic dict reads and writes, with a cache miss at worst redoing a lookup.
+    """
+    from bcbio.pipeline import qcsummary
+    item["dirs"] = dirs
+    if "name" not in item:
+        item["name"] = ["", item["description"]]
+    elif isinstance(item["name"], six.string_types):
+        description = "%s-%s" % (item["name"], clean_name(item["description"]))
+        item["name"] = [item["name"], description]
+        item["description"] = description
+    # add algorithm details to configuration, avoid double specification
+    item["resources"] = _add_remote_resources(item["resources"])
+    item["config"] = config_utils.update_w_custom(config, item)
+    item.pop("algorithm", None)
+    item = add_reference_resources(item, remote_retriever, cache=ref_cache)
+    item["config"]["algorithm"]["qc"] = qcsummary.get_qc_tools(item)
+    item["config"]["algorithm"]["vcfanno"] = vcfanno.find_annotations(item, remote_retriever)
+    # Create temporary directories and make absolute, expanding environmental variables
+    tmp_dir = tz.get_in(["config", "resources", "tmp", "dir"], item)
+    if tmp_dir:
+        # if no environmental variables, make and normalize the directory
+        # otherwise we normalize later in distributed.transaction:
+        if os.path.expandvars(tmp_dir) == tmp_dir:
+            tmp_dir = utils.safe_makedir(os.path.expandvars(tmp_dir))
+            tmp_dir = genome.abs_file_paths(tmp_dir, do_download=not integrations)
+        item["config"]["resources"]["tmp"]["dir"] = tmp_dir
+    return item
+
 def organize(dirs, config, run_info_yaml, sample_names=None, is_cwl=False,
              integrations=None):
     """Organize run information from a passed YAML file or the Galaxy API.
@@ -53,11 +143,18 @@ def organize(dirs, config, run_info_yaml, sample_names=None, is_cwl=False,
     sample_names is a list of samples to include from the overall file, for cases
     where we are running multiple pipelines from the same configuration file.
     """
-    from bcbio.pipeline import qcsummary
     if integrations is None: integrations = {}
     logger.info("Using input YAML configuration: %s" % run_info_yaml)
     assert run_info_yaml and os.path.exists(run_info_yaml), \
         "Did not find input sample YAML file: %s" % run_info_yaml
+    use_cache = (os.environ.get("BCBIO_RUNINFO_CACHE") == "1"
+                 and not sample_names and not integrations)
+    if use_cache:
+        cached = _read_run_info_cache(run_info_yaml)
+        if cached is not None:
+            for item in cached:
+                item["dirs"] = dirs
+            return _add_provenance(cached, dirs, config, not is_cwl)
     run_details = _run_info_from_yaml(dirs, run_info_yaml, config, sample_names,
                                       is_cwl=is_cwl, integrations=integrations)
     remote_retriever = None
@@ -65,32 +162,20 @@ def organize(dirs, config, run_info_yaml, sample_names=None, is_cwl=False,
         if iname in config:
             run_details = retriever.add_remotes(run_details, config[iname])
             remote_retriever = retriever
-    out = []
-    for item in run_details:
-        item["dirs"] = dirs
-        if "name" not in item:
-            item["name"] = ["", item["description"]]
-        elif isinstance(item["name"], six.string_types):
-            description = "%s-%s" % (item["name"], clean_name(item["description"]))
-            item["name"] = [item["name"], description]
-            item["description"] = description
-        # add algorithm details to configuration, avoid double specification
-        item["resources"] = _add_remote_resources(item["resources"])
-        item["config"] = config_utils.update_w_custom(config, item)
-        item.pop("algorithm", None)
-        item = add_reference_resources(item, remote_retriever)
-        item["config"]["algorithm"]["qc"] = qcsummary.get_qc_tools(item)
-        item["config"]["algorithm"]["vcfanno"] = vcfanno.find_annotations(item, remote_retriever)
-        # Create temporary directories and make absolute, expanding environmental variables
-        tmp_dir = tz.get_in(["config", "resources", "tmp", "dir"], item)
-        if tmp_dir:
-            # if no environmental variables, make and normalize the directory
-            # otherwise we normalize later in distributed.transaction:
-            if os.path.expandvars(tmp_dir) == tmp_dir:
-                tmp_dir = utils.safe_makedir(os.path.expandvars(tmp_dir))
-                tmp_dir = genome.abs_file_paths(tmp_dir, do_download=not integrations)
-            item["config"]["resources"]["tmp"]["dir"] = tmp_dir
-        out.append(item)
+    # reference lookups shared between samples on the same genome build
+    ref_cache = {}
+
+    def _finalize(item):
+        return _organize_item(item, dirs, config, remote_retriever, integrations, ref_cache)
+    # the per-item work is dominated by filesystem checks, so overlap the
+    # latency across samples with threads
+    if futures and len(run_details) > 1:
+        with futures.ThreadPoolExecutor(max_workers=min(16, len(run_details))) as pool:
+            out = list(pool.map(_finalize, run_details))
+    else:
+        out = [_finalize(item) for item in run_details]
+    if use_cache:
+        _write_run_info_cache(run_info_yaml, out)
     out = _add_provenance(out, dirs, config, not is_cwl)
     return out
 
@@ -100,21 +185,21 @@ def normalize_world(data):
     data = _normalize_files(data)
     return data
 
+def _attach_provenance(item, p, d, p_db):
+    entity_id = diagnostics.store_entity(item)
+    item["config"]["resources"]["program_versions"] = p
+    item["provenance"] = {"programs": p, "entity": entity_id,
+                          "db": p_db, "data": d}
+    return item
+
 def _add_provenance(items, dirs, config, add_provenance=True):
-    if add_provenance:
-        p = programs.write_versions(dirs, config=config)
-        d = provenancedata.write_versions(dirs, items)
-        versioncheck.testall(items)
-        p_db = diagnostics.initialize(dirs)
-    out = []
-    for item in items:
-        if add_provenance:
-            entity_id = diagnostics.store_entity(item)
-            item["config"]["resources"]["program_versions"] = p
-            item["provenance"] = {"programs": p, "entity": entity_id,
-                                  "db": p_db, "data": d}
-        out.append([item])
-    return out
+    if not add_provenance:
+        return [[item] for item in items]
+    p = programs.write_versions(dirs, config=config)
+    d = provenancedata.write_versions(dirs, items)
+    versioncheck.testall(items)
+    p_db = diagnostics.initialize(dirs)
+    return [[_attach_provenance(item, p, d, p_db)] for item in items]
 
 def setup_directories(work_dir, fc_dir, config, config_file):
     fastq_dir, galaxy_dir, config_dir = _get_full_paths(flowcell.get_fastq_dir(fc_dir)
@@ -143,58 +228,80 @@ def _get_full_paths(fastq_dir, config, config_file):
 def _add_remote_resources(resources):
     """Retrieve remote resources like GATK/MuTect jars present in S3.
     """
-    out = copy.deepcopy(resources)
-    for prog, info in resources.items():
-        for key, val in info.items():
-            if key == "jar" and objectstore.is_remote(val):
-                store_dir = utils.safe_makedir(os.path.join(os.getcwd(), "inputs", "jars", prog))
-                fname = objectstore.download(val, store_dir, store_dir)
-                version_file = os.path.join(store_dir, "version.txt")
-                if not utils.file_exists(version_file):
-                    version = install.get_gatk_jar_version(prog, fname)
-                    with open(version_file, "w") as out_handle:
-                        out_handle.write(version)
-                else:
-                    with open(version_file) as in_handle:
-                        version = in_handle.read().strip()
-                del out[prog][key]
-                out[prog]["dir"] = store_dir
-                out[prog]["version"] = version
+    touched = set(prog for prog, info in resources.items()
+                  if "jar" in info and objectstore.is_remote(info["jar"]))
+    if not touched:
+        return resources
+    # only shallow copy the programs we rewrite, sharing the rest
+    out = {prog: (dict(info) if prog in touched else info)
+           for prog, info in resources.items()}
+    for prog in sorted(touched):
+        val = resources[prog]["jar"]
+        store_dir = utils.safe_makedir(os.path.join(os.getcwd(), "inputs", "jars", prog))
+        fname = objectstore.download(val, store_dir, store_dir)
+        version_file = os.path.join(store_dir, "version.txt")
+        if not utils.file_exists(version_file):
+            version = install.get_gatk_jar_version(prog, fname)
+            with open(version_file, "w") as out_handle:
+                out_handle.write(version)
+        else:
+            with open(version_file) as in_handle:
+                version = in_handle.read().strip()
+        del out[prog]["jar"]
+        out[prog]["dir"] = store_dir
+        out[prog]["version"] = version
     return out
 
 # ## Genome reference information
 
-def add_reference_resources(data, remote_retriever=None):
+def add_reference_resources(data, remote_retriever=None, cache=None):
     """Add genome reference information to the item to process.
+
+    cache, when supplied, shares reference lookups between samples with the
+    same genome build and aligner, avoiding repeated contig scans and file
+    discovery for multi-sample cohorts on a single genome.
     """
     aligner = data["config"]["algorithm"].get("aligner", None)
-    if remote_retriever:
-        data["reference"] = remote_retriever.get_refs(data["genome_build"],
-                                                      alignment.get_aligner_with_aliases(aligner, data),
-                                                      data["config"])
-    else:
-        data["reference"] = genome.get_refs(data["genome_build"], alignment.get_aligner_with_aliases(aligner, data),
-                                            data["dirs"]["galaxy"], data)
-        _check_ref_files(data["reference"], data)
-    # back compatible `sam_ref` target
-    data["sam_ref"] = utils.get_in(data, ("reference", "fasta", "base"))
-    ref_loc = utils.get_in(data, ("config", "resources", "species", "dir"),
-                           utils.get_in(data, ("reference", "fasta", "base")))
-    if remote_retriever:
-        data = remote_retriever.get_resources(data["genome_build"], ref_loc, data)
+    cache_key = ((data["genome_build"], aligner, tz.get_in(["dirs", "galaxy"], data),
+                  effects.get_type(data))
+                 if cache is not None and not remote_retriever else None)
+    cached = cache.get(cache_key) if cache_key else None
+    if cached is not None:
+        data["reference"] = copy.deepcopy(cached["reference"])
+        data["genome_resources"] = copy.deepcopy(cached["genome_resources"])
+        # back compatible `sam_ref` target
+        data["sam_ref"] = utils.get_in(data, ("reference", "fasta", "base"))
     else:
-        data["genome_resources"] = genome.get_resources(data["genome_build"], ref_loc, data)
-    data["genome_resources"] = genome.add_required_resources(data["genome_resources"])
-    if effects.get_type(data) == "snpeff" and "snpeff" not in data["reference"]:
-        data["reference"]["snpeff"] = effects.get_snpeff_files(data)
-    if "genome_context" not in data["reference"]:
-        data["reference"]["genome_context"] = annotation.get_context_files(data)
-    if "viral" not in data["reference"]:
-        data["reference"]["viral"] = viral.get_files(data)
-    if not data["reference"]["viral"]:
-        data["reference"]["viral"] = None
-    if "versions" not in data["reference"]:
-        data["reference"]["versions"] = _get_data_versions(data)
+        if remote_retriever:
+            data["reference"] = remote_retriever.get_refs(data["genome_build"],
+                                                          alignment.get_aligner_with_aliases(aligner, data),
+                                                          data["config"])
+        else:
+            data["reference"] = genome.get_refs(data["genome_build"], alignment.get_aligner_with_aliases(aligner, data),
+                                                data["dirs"]["galaxy"], data)
+            _check_ref_files(data["reference"], data)
+        # back compatible `sam_ref` target
+        data["sam_ref"] = utils.get_in(data, ("reference", "fasta", "base"))
+        ref_loc = utils.get_in(data, ("config", "resources", "species", "dir"),
+                               utils.get_in(data, ("reference", "fasta", "base")))
+        if remote_retriever:
+            data = remote_retriever.get_resources(data["genome_build"], ref_loc, data)
+        else:
+            data["genome_resources"] = genome.get_resources(data["genome_build"], ref_loc, data)
+        data["genome_resources"] = genome.add_required_resources(data["genome_resources"])
+        if effects.get_type(data) == "snpeff" and "snpeff" not in data["reference"]:
+            data["reference"]["snpeff"] = effects.get_snpeff_files(data)
+        if "genome_context" not in data["reference"]:
+            data["reference"]["genome_context"] = annotation.get_context_files(data)
+        if "viral" not in data["reference"]:
+            data["reference"]["viral"] = viral.get_files(data)
+        if not data["reference"]["viral"]:
+            data["reference"]["viral"] = None
+        if "versions" not in data["reference"]:
+            data["reference"]["versions"] = _get_data_versions(data)
+        if cache_key is not None:
+            cache[cache_key] = {"reference": copy.deepcopy(data["reference"]),
+                                "genome_resources": copy.deepcopy(data["genome_resources"])}
 
     data = _fill_validation_targets(data)
     data = _fill_prioritization_targets(data)
@@ -214,7 +321,32 @@ def _get_data_versions(data):
             return version_file
     return None
 
-def _check_ref_files(ref_info, data):
+_contig_problem_cache = {}
+
+def _contig_name_problems(fasta_file, config, thorough=False):
+    """Report reference contigs with non-allowed name characters.
+
+    Stops at the first offending contig by default since any problem aborts
+    the run; thorough reports every bad name. Cached on the FASTA path and
+    mtime so the contig scan happens once per reference per process.
+    """
+    key = (fasta_file, os.path.getmtime(fasta_file)) if os.path.exists(fasta_file) else None
+    if key is not None and key in _contig_problem_cache:
+        return _contig_problem_cache[key]
+    problems = []
+    for contig in ref.file_contigs(fasta_file, config):
+        cur_problems = contig.name.translate(_CONTIG_NAME_DEL_TABLE)
+        if cur_problems:
+            problems.append("Found non-allowed characters in chromosome name %s: %s" %
+                            (contig.name, " ".join(sorted(set(cur_problems)))))
+            if not thorough:
+                break
+    # an early exit leaves the scan incomplete, so only cache full results
+    if key is not None and (thorough or not problems):
+        _contig_problem_cache[key] = problems
+    return problems
+
+def _check_ref_files(ref_info, data, thorough=False):
     problems = []
     if not data["genome_build"]:
         problems.append("Did not find 'genome_build' for sample: %s" % dd.get_sample_name(data))
@@ -222,18 +354,38 @@ def _check_ref_files(ref_info, data):
         problems.append("Did not find fasta reference file for genome %s.\n" % (data["genome_build"]) +
                         "Check tool-data/*.loc files to ensure paths to reference data are correct.")
     else:
-        for contig in ref.file_contigs(ref_info["fasta"]["base"], data["config"]):
-            cur_problems = set([])
-            for char in list(contig.name):
-                if char not in ALLOWED_CONTIG_NAME_CHARS:
-                    cur_problems.add(char)
-            if len(cur_problems) > 0:
-                problems.append("Found non-allowed characters in chromosome name %s: %s" %
-                                (contig.name, " ".join(list(cur_problems))))
+        problems.extend(_contig_name_problems(ref_info["fasta"]["base"], data["config"], thorough=thorough))
     if len(problems) > 0:
         msg = ("\nProblems with input reference file %s\n" % tz.get_in(["fasta", "base"], ref_info))
         raise ValueError(msg + "\n".join(problems) + "\n")
 
+# Cached filesystem and remote lookups: the _fill_* helpers probe the same
+# installed reference paths for every sample in a run.
+
+@functools.lru_cache(maxsize=4096)
+def _exists_cached(path):
+    return os.path.exists(path)
+
+@functools.lru_cache(maxsize=4096)
+def _is_remote_cached(path):
+    return objectstore.is_remote(path)
+
+@functools.lru_cache(maxsize=1)
+def _sv_annotation_dir():
+    """Resolved directory of simple_sv_annotation.py, scanning PATH only once.
+    """
+    simple_sv_bin = utils.which("simple_sv_annotation.py")
+    return os.path.dirname(os.path.realpath(simple_sv_bin)) if simple_sv_bin else None
+
+@functools.lru_cache(maxsize=256)
+def _list_dir(dname):
+    """Cached directory listing: one readdir per probed directory per run.
+    """
+    try:
+        return tuple(sorted(f.name for f in os.scandir(dname)))
+    except OSError:
+        return ()
+
 def _fill_validation_targets(data):
     """Fill validation targets pointing to globally installed truth sets.
     """
@@ -243,10 +395,15 @@ def _fill_validation_targets(data):
                   else [["svvalidate"]])
     for vtarget in [list(xs) for xs in [["validate"], ["validate_regions"]] + list(sv_targets)]:
         val = tz.get_in(["config", "algorithm"] + vtarget, data)
-        if val and not os.path.exists(val) and not objectstore.is_remote(val):
+        if val and not _exists_cached(val) and not _is_remote_cached(val):
             installed_val = os.path.normpath(os.path.join(os.path.dirname(ref_file), os.pardir, "validation", val))
-            if os.path.exists(installed_val):
-                data = tz.update_in(data, ["config", "algorithm"] + vtarget, lambda x: installed_val)
+            if _exists_cached(installed_val):
+                # the path is fixed and known present, so assign directly rather
+                # than paying for an immutable update_in traversal
+                alg = data["config"]["algorithm"]
+                for k in vtarget[:-1]:
+                    alg = alg[k]
+                alg[vtarget[-1]] = installed_val
             else:
                 raise ValueError("Configuration problem. Validation file not found for %s: %s" %
                                  (vtarget, val))
@@ -259,19 +416,19 @@ def _fill_capture_regions(data):
     ref_file = dd.get_ref_file(data)
     for target in ["variant_regions", "sv_regions", "coverage"]:
         val = tz.get_in(["config", "algorithm", target], data)
-        if val and not os.path.exists(val) and not objectstore.is_remote(val):
-            installed_vals = []
-            # Check prioritize directory
-            for ext in [".bed", ".bed.gz"]:
-                installed_vals += glob.glob(os.path.normpath(os.path.join(os.path.dirname(ref_file), os.pardir,
-                                                                          "coverage", val + ext)))
+        if val and not _exists_cached(val) and not _is_remote_cached(val):
+            # Check coverage directory against a cached listing
+            target_dir, target_base = os.path.split(os.path.normpath(
+                os.path.join(os.path.dirname(ref_file), os.pardir, "coverage", val)))
+            installed_vals = [os.path.join(target_dir, fname) for fname in _list_dir(target_dir)
+                              if fname in ("%s.bed" % target_base, "%s.bed.gz" % target_base)]
             if len(installed_vals) == 0:
                 if target not in special_targets or not val.startswith(special_targets[target]):
                     raise ValueError("Configuration problem. BED file not found for %s: %s" %
                                      (target, val))
             else:
                 assert len(installed_vals) == 1, installed_vals
-                data = tz.update_in(data, ["config", "algorithm", target], lambda x: installed_vals[0])
+                data["config"]["algorithm"][target] = installed_vals[0]
     return data
 
 def _fill_prioritization_targets(data):
@@ -280,19 +437,19 @@ def _fill_prioritization_targets(data):
     ref_file = dd.get_ref_file(data)
     for target in ["svprioritize", "coverage"]:
         val = tz.get_in(["config", "algorithm", target], data)
-        if val and not os.path.exists(val) and not objectstore.is_remote(val):
-            installed_vals = []
-            # Check prioritize directory
-            for ext in [".bed", ".bed.gz"]:
-                installed_vals += glob.glob(os.path.normpath(os.path.join(os.path.dirname(ref_file), os.pardir,
-                                                                          "coverage", "prioritize",
-                                                                          val + "*%s" % ext)))
+        if val and not _exists_cached(val) and not _is_remote_cached(val):
+            # Check prioritize directory against a cached listing
+            target_dir, target_base = os.path.split(os.path.normpath(
+                os.path.join(os.path.dirname(ref_file), os.pardir, "coverage", "prioritize", val)))
+            installed_vals = [os.path.join(target_dir, fname) for fname in _list_dir(target_dir)
+                              if fname.startswith(target_base) and fname.endswith((".bed", ".bed.gz"))]
             # Check sv-annotation directory for prioritize gene name lists
             if target == "svprioritize":
-                simple_sv_bin = utils.which("simple_sv_annotation.py")
-                if simple_sv_bin:
-                    installed_vals += glob.glob(os.path.join(os.path.dirname(os.path.realpath(simple_sv_bin)),
-                                                             "%s*" % os.path.basename(val)))
+                sv_dir = _sv_annotation_dir()
+                if sv_dir:
+                    val_base = os.path.basename(val)
+                    installed_vals += [os.path.join(sv_dir, fname) for fname in _list_dir(sv_dir)
+                                       if fname.startswith(val_base)]
             if len(installed_vals) == 0:
                 # some targets can be filled in later
                 if target not in set(["coverage"]):
@@ -312,7 +469,7 @@ def _fill_prioritization_targets(data):
                 # handle date-stamped inputs
                 if not installed_val:
                     installed_val = sorted(installed_vals, reverse=True)[0]
-            data = tz.update_in(data, ["config", "algorithm", target], lambda x: installed_val)
+            data["config"]["algorithm"][target] = installed_val
     return data
 
 # ## Sample and BAM read group naming
@@ -323,7 +480,10 @@ def _clean_metadata(data):
     # Ensure batches are strings and have no duplicates
     if batches:
         if isinstance(batches, (list, tuple)):
-            batches = [_clean_characters(x) for x in sorted(list(set(batches)))]
+            # only re-deduplicate when the input actually has repeats
+            if len(set(batches)) != len(batches):
+                batches = set(batches)
+            batches = [_clean_characters(x) for x in sorted(batches)]
         else:
             batches = _clean_characters(batches)
         data["metadata"]["batch"] = batches
@@ -380,18 +540,19 @@ def _clean_background(data):
     errors = []
     if val:
         out = {}
+        cwd_dirs = [os.getcwd()]
         # old style specification, single string for variant
         if isinstance(val, six.string_types):
-            out["variant"] = _file_to_abs(val, [os.getcwd()])
+            out["variant"] = _file_to_abs(val, cwd_dirs)
         elif isinstance(val, dict):
             for k, v in val.items():
                 if k in allowed_keys:
                     if isinstance(v, six.string_types):
-                        out[k] = _file_to_abs(v, [os.getcwd()])
+                        out[k] = _file_to_abs(v, cwd_dirs)
                     else:
                         assert isinstance(v, dict)
                         for ik, iv in v.items():
-                            v[ik] = _file_to_abs(iv, [os.getcwd()])
+                            v[ik] = _file_to_abs(iv, cwd_dirs)
                         out[k] = v
                 else:
                     errors.append("Unexpected key: %s" % k)
@@ -405,18 +566,23 @@ def _clean_background(data):
         data["algorithm"]["background"] = out
     return data
 
+_CLEAN_TABLE = str.maketrans({c: "_" for c in " ./\\[]&;#+:)("})
+
+@functools.lru_cache(maxsize=4096)
+def _clean_characters_str(x):
+    """Cached cleaning of string inputs, which repeat across lanes and batches.
+    """
+    if not all(ord(char) < 128 for char in x):
+        msg = "Found unicode character in input YAML (%s)" % (x)
+        raise ValueError(repr(msg))
+    return x.translate(_CLEAN_TABLE)
+
 def _clean_characters(x):
     """Clean problem characters in sample lane or descriptions.
     """
     if not isinstance(x, six.string_types):
         x = str(x)
-    else:
-        if not all(ord(char) < 128 for char in x):
-            msg = "Found unicode character in input YAML (%s)" % (x)
-            raise ValueError(repr(msg))
-    for problem in [" ", ".", "/", "\\", "[", "]", "&", ";", "#", "+", ":", ")", "("]:
-        x = x.replace(problem, "_")
-    return x
+    return _clean_characters_str(x)
 
 def prep_rg_names(item, config, fc_name, fc_date):
     """Generate read group names from item inputs.
@@ -428,8 +594,7 @@ def prep_rg_names(item, config, fc_name, fc_date):
     return {"rg": item["description"],
             "sample": item["description"],
             "lane": lane_name,
-            "pl": (tz.get_in(["algorithm", "platform"], item)
-                   or tz.get_in(["algorithm", "platform"], item, "illumina")).lower(),
+            "pl": (tz.get_in(["algorithm", "platform"], item) or "illumina").lower(),
             "lb": tz.get_in(["metadata", "library"], item),
             "pu": tz.get_in(["metadata", "platform_unit"], item) or lane_name}
 
@@ -438,15 +603,11 @@ def prep_rg_names(item, config, fc_name, fc_date):
 def _check_for_duplicates(xs, attr, check_fn=None):
     """Identify and raise errors on duplicate items.
     """
-    dups = []
-    for key, vals in itertools.groupby(x[attr] for x in xs):
-        if len(list(vals)) > 1:
-            dups.append(key)
+    counts = collections.Counter(x[attr] for x in xs)
+    dups = [key for key, count in counts.items() if count > 1]
     if len(dups) > 0:
-        psamples = []
-        for x in xs:
-            if x[attr] in dups:
-                psamples.append(x)
+        dup_set = set(dups)
+        psamples = [x for x in xs if x[attr] in dup_set]
         # option to skip problem based on custom input function.
         if check_fn and check_fn(psamples):
             return
@@ -458,16 +619,17 @@ def _check_for_duplicates(xs, attr, check_fn=None):
 def _check_for_batch_clashes(xs):
     """Check that batch names do not overlap with sample names.
     """
-    names = set([x["description"] for x in xs])
-    dups = set([])
+    names = set([])
+    all_batches = set([])
     for x in xs:
+        names.add(x["description"])
         batches = tz.get_in(("metadata", "batch"), x)
         if batches:
-            if not isinstance(batches, (list, tuple)):
-                batches = [batches]
-            for batch in batches:
-                if batch in names:
-                    dups.add(batch)
+            if isinstance(batches, (list, tuple)):
+                all_batches.update(batches)
+            else:
+                all_batches.add(batches)
+    dups = all_batches & names
     if len(dups) > 0:
         raise ValueError("Batch names must be unique from sample descriptions.\n"
                          "Clashing batch names: %s" % sorted(list(dups)))
@@ -480,7 +642,9 @@ def _check_for_problem_somatic_batches(items, config):
     """
     to_check = []
     for data in items:
-        data = copy.deepcopy(data)
+        # shallow overlay: the batch checks below only read top level keys
+        # and the freshly built config, so avoid deep copying reference blobs
+        data = dict(data)
         data["config"] = config_utils.update_w_custom(config, data)
         to_check.append(data)
     data_by_batches = collections.defaultdict(list)
@@ -534,28 +698,31 @@ def _check_for_degenerate_interesting_groups(items):
             raise ValueError("group %s is marked as an interesting group, "
                              "but all samples have the same value." % group)
 
-TOPLEVEL_KEYS = set(["description", "analysis", "genome_build", "metadata", "algorithm",
-                     "resources", "files", "vrn_file", "lane", "upload", "rgnames"])
-ALGORITHM_KEYS = set(["bam_sort", "custom_trim", "kraken", "write_summary",
-                      "merge_bamprep", "indelcaller", "effects",
-                      "svvalidate", "hlavalidate", "phasing", "validate",
-                      "validate_regions", "validate_genome_build", "validate_method",
-                      "clinical_reporting", "nomap_split_size",
-                      "nomap_split_targets", "background", "qc", "preseq",] +
-                     # back compatibility
-                     ["remove_lcr", "coverage_depth_max", "coverage_depth"] +
-                     # from datadict.LOOKUPS
-                     dd.get_algorithm_keys())
-ALG_ALLOW_BOOLEANS = set(["merge_bamprep", "mark_duplicates", "remove_lcr",
-                          "demultiplexed", "clinical_reporting", "transcriptome_align",
-                          "fusion_mode", "assemble_transcripts", "trim_reads",
-                          "quantify_genome_alignments",
-                          "recalibrate", "realign", "cwl_reporting", "save_diskspace", "keep_multimapped",
-                          "keep_duplicates"])
-ALG_ALLOW_FALSE = set(["aligner", "align_split_size", "bam_clean", "bam_sort",
-                       "effects", "phasing", "mixup_check", "indelcaller",
-                       "variantcaller", "positional_umi", "maxcov_downsample", "preseq",
-                       "use_lowfreq_filter"])
+TOPLEVEL_KEYS = frozenset(["description", "analysis", "genome_build", "metadata", "algorithm",
+                           "resources", "files", "vrn_file", "lane", "upload", "rgnames"])
+ALGORITHM_KEYS = frozenset(["bam_sort", "custom_trim", "kraken", "write_summary",
+                            "merge_bamprep", "indelcaller", "effects",
+                            "svvalidate", "hlavalidate", "phasing", "validate",
+                            "validate_regions", "validate_genome_build", "validate_method",
+                            "clinical_reporting", "nomap_split_size",
+                            "nomap_split_targets", "background", "qc", "preseq",] +
+                           # back compatibility
+                           ["remove_lcr", "coverage_depth_max", "coverage_depth"] +
+                           # from datadict.LOOKUPS
+                           dd.get_algorithm_keys())
+ALG_ALLOW_BOOLEANS = frozenset(["merge_bamprep", "mark_duplicates", "remove_lcr",
+                                "demultiplexed", "clinical_reporting", "transcriptome_align",
+                                "fusion_mode", "assemble_transcripts", "trim_reads",
+                                "quantify_genome_alignments",
+                                "recalibrate", "realign", "cwl_reporting", "save_diskspace",
+                                "keep_multimapped", "keep_duplicates"])
+ALG_ALLOW_FALSE = frozenset(["aligner", "align_split_size", "bam_clean", "bam_sort",
+                             "effects", "phasing", "mixup_check", "indelcaller",
+                             "variantcaller", "positional_umi", "maxcov_downsample", "preseq",
+                             "use_lowfreq_filter"])
+# top level keys that should never be nested under algorithm
+MISPLACED_IN_ALGORITHM_KEYS = ("resources", "metadata", "analysis",
+                               "description", "genome_build", "lane", "files")
 
 ALG_DOC_URL = "https://bcbio-nextgen.readthedocs.org/en/latest/contents/configuration.html#algorithm-parameters"
 
@@ -565,7 +732,7 @@ def _check_algorithm_keys(item):
     Needs to be manually updated when introducing new keys, but avoids silent bugs
     with typos in key names.
     """
-    problem_keys = [k for k in item["algorithm"].keys() if k not in ALGORITHM_KEYS]
+    problem_keys = sorted(item["algorithm"].keys() - ALGORITHM_KEYS)
     if len(problem_keys) > 0:
         raise ValueError("Unexpected configuration keyword in 'algorithm' section: %s\n"
                          "See configuration documentation for supported options:\n%s\n"
@@ -591,17 +758,17 @@ def _check_algorithm_values(item):
 def _check_toplevel_misplaced(item):
     """Check for algorithm keys accidentally placed at the top level.
     """
-    problem_keys = [k for k in item.keys() if k in ALGORITHM_KEYS]
+    problem_keys = sorted(item.keys() & ALGORITHM_KEYS)
     if len(problem_keys) > 0:
         raise ValueError("Unexpected configuration keywords found in top level of %s: %s\n"
                          "This should be placed in the 'algorithm' section."
                          % (item["description"], problem_keys))
-    problem_keys = [k for k in item.keys() if k not in TOPLEVEL_KEYS]
+    problem_keys = sorted(item.keys() - TOPLEVEL_KEYS)
     if len(problem_keys) > 0:
         raise ValueError("Unexpected configuration keywords found in top level of %s: %s\n"
                          % (item["description"], problem_keys))
 
-def _detect_fastq_format(in_file, MAX_RECORDS=1000):
+def _detect_fastq_format(in_file, MAX_RECORDS=200):
     ranges = {"sanger": (33, 126),
               "solexa": (59, 126),
               "illumina_1.3+": (64, 126),
@@ -611,27 +778,32 @@ def _detect_fastq_format(in_file, MAX_RECORDS=1000):
     possible = set(ranges.keys())
 
     with closing(open_fastq(in_file)) as in_handle:
-        four = itertools.islice(in_handle, 3, None, 4)
         count = 0
-        for line in four:
-            if len(possible) == 1:
-                return possible
-            if count > MAX_RECORDS:
+        for i, line in enumerate(in_handle):
+            if i % 4 != 3:
+                continue
+            if count >= MAX_RECORDS:
                 break
             count += 1
-            vals = [ord(c) for c in line.rstrip()]
+            quals = np.frombuffer(line.rstrip().encode(), dtype=np.uint8)
             # if there is a short sequence, skip it
-            if len(vals) < 20:
+            if quals.size < 20:
                 continue
-            lmin = min(vals)
-            lmax = max(vals)
-            for encoding, (emin, emax) in ranges.items():
-                if encoding in possible:
-                    if lmin < emin or lmax > emax:
-                        possible.remove(encoding)
+            lmin = int(quals.min())
+            lmax = int(quals.max())
+            # only re-derive the candidate encodings when the range widens
+            if lmin < gmin or lmax > gmax:
+                gmin = min(gmin, lmin)
+                gmax = max(gmax, lmax)
+                possible = set(encoding for encoding, (emin, emax) in ranges.items()
+                               if gmin >= emin and gmax <= emax)
+                if len(possible) == 1:
+                    return possible
 
     return possible
 
+_FASTQ_SUFFIXES = ("fq.gz", "fastq.gz", ".fastq", ".fq")
+
 def _check_quality_format(items):
     """
     Check if quality_format="standard" and fastq_format is not sanger
@@ -641,7 +813,6 @@ def _check_quality_format(items):
                      "illumina_1.8+": "standard",
                      "solexa": "solexa",
                      "sanger": "standard"}
-    fastq_extensions = ["fq.gz", "fastq.gz", ".fastq", ".fq"]
 
     for item in items:
         specified_format = item["algorithm"].get("quality_format", "standard").lower()
@@ -650,7 +821,7 @@ def _check_quality_format(items):
                              "is not supported. Supported values are %s."
                              % (SAMPLE_FORMAT.values()))
 
-        fastq_file = next((f for f in item.get("files") or [] if f.endswith(tuple(fastq_extensions))), None)
+        fastq_file = next((f for f in item.get("files") or [] if f.endswith(_FASTQ_SUFFIXES)), None)
 
         if fastq_file and specified_format and not objectstore.is_remote(fastq_file):
             fastq_format = _detect_fastq_format(fastq_file)
@@ -673,10 +844,26 @@ def _check_aligner(item):
                          "Supported options: %s\n" %
                          (item["algorithm"].get("aligner"), sorted(list(allowed))))
 
+# Allowed caller choices are static per process; compute them lazily once
+# rather than rebuilding the collections for every sample checked.
+
+@functools.lru_cache(maxsize=1)
+def _allowed_variantcallers():
+    return frozenset(genotype.get_variantcallers().keys()) | frozenset([None, False])
+
+@functools.lru_cache(maxsize=1)
+def _allowed_svcallers():
+    return frozenset(itertools.chain.from_iterable(structural._CALLERS.values())) | \
+        frozenset([None, False])
+
+@functools.lru_cache(maxsize=1)
+def _allowed_jointcallers():
+    return frozenset(joint.get_callers()) | frozenset([None, False])
+
 def _check_variantcaller(item):
     """Ensure specified variantcaller is a valid choice.
     """
-    allowed = set(list(genotype.get_variantcallers().keys()) + [None, False])
+    allowed = _allowed_variantcallers()
     vcs = item["algorithm"].get("variantcaller")
     if not isinstance(vcs, dict):
         vcs = {"variantcaller": vcs}
@@ -697,7 +884,7 @@ def _check_variantcaller(item):
 def _check_svcaller(item):
     """Ensure the provide structural variant caller is valid.
     """
-    allowed = set(reduce(operator.add, [list(d.keys()) for d in structural._CALLERS.values()]) + [None, False])
+    allowed = _allowed_svcallers()
     svs = item["algorithm"].get("svcaller")
     if not isinstance(svs, (list, tuple)):
         svs = [svs]
@@ -731,7 +918,7 @@ def _check_hetcaller(item):
 def _check_jointcaller(data):
     """Ensure specified jointcaller is valid.
     """
-    allowed = set(joint.get_callers() + [None, False])
+    allowed = _allowed_jointcallers()
     cs = data["algorithm"].get("jointcaller", [])
     if not isinstance(cs, (tuple, list)):
         cs = [cs]
@@ -783,25 +970,33 @@ def _check_sample_config(items, in_file, config):
     _check_for_degenerate_interesting_groups(items)
     _check_for_batch_clashes(items)
     _check_for_problem_somatic_batches(items, config)
-    _check_for_misplaced(items, "algorithm",
-                         ["resources", "metadata", "analysis",
-                          "description", "genome_build", "lane", "files"])
-
-    [_check_toplevel_misplaced(x) for x in items]
-    [_check_algorithm_keys(x) for x in items]
-    [_check_algorithm_values(x) for x in items]
-    [_check_aligner(x) for x in items]
-    [_check_variantcaller(x) for x in items]
-    [_check_svcaller(x) for x in items]
-    [_check_hetcaller(x) for x in items]
-    [_check_indelcaller(x) for x in items]
-    [_check_jointcaller(x) for x in items]
-    [_check_hlacaller(x) for x in items]
-    [_check_realign(x) for x in items]
-    [_check_trim(x) for x in items]
+    _check_for_misplaced(items, "algorithm", MISPLACED_IN_ALGORITHM_KEYS)
+
+    for x in items:
+        _check_toplevel_misplaced(x)
+        _check_algorithm_keys(x)
+        _check_algorithm_values(x)
+        _check_aligner(x)
+        _check_variantcaller(x)
+        _check_svcaller(x)
+        _check_hetcaller(x)
+        _check_indelcaller(x)
+        _check_jointcaller(x)
+        _check_hlacaller(x)
+        _check_realign(x)
+        _check_trim(x)
 
 # ## Read bcbio_sample.yaml files
 
+@functools.lru_cache(maxsize=64)
+def _dir_contents(dname):
+    """Cached directory listing, batching existence checks for sibling inputs.
+    """
+    try:
+        return frozenset(os.listdir(dname))
+    except OSError:
+        return frozenset()
+
 def _file_to_abs(x, dnames, makedir=False):
     """Make a file absolute using the supplied base directory choices.
     """
@@ -815,10 +1010,14 @@ def _file_to_abs(x, dnames, makedir=False):
         for dname in dnames:
             if dname:
                 normx = os.path.normpath(os.path.join(dname, x))
-                if os.path.exists(normx):
+                if makedir:
+                    if not os.path.exists(normx):
+                        utils.safe_makedir(normx)
                     return normx
-                elif makedir:
-                    utils.safe_makedir(normx)
+                # listing check first, one readdir covering all sibling files;
+                # fall back to a stat for files created after the listing
+                if os.path.basename(normx) in _dir_contents(os.path.dirname(normx)) \
+                   or os.path.exists(normx):
                     return normx
         raise ValueError("Did not find input file %s in %s" % (x, dnames))
 
@@ -830,8 +1029,10 @@ def _normalize_files(item, fc_dir=None):
     if files:
         if isinstance(files, six.string_types):
             files = [files]
-        fastq_dir = flowcell.get_fastq_dir(fc_dir) if fc_dir else os.getcwd()
-        files = [_file_to_abs(x, [os.getcwd(), fc_dir, fastq_dir]) for x in files]
+        cwd = os.getcwd()
+        fastq_dir = flowcell.get_fastq_dir(fc_dir) if fc_dir else cwd
+        dnames = [d for d in (cwd, fc_dir, fastq_dir) if d]
+        files = [_file_to_abs(x, dnames) for x in files]
         files = [x for x in files if x]
         _sanity_check_files(item, files)
         item["files"] = files
@@ -843,10 +1044,11 @@ def _sanity_check_files(item, files):
     Handles BAM, fastqs, plus split fastqs.
     """
     msg = None
-    file_types = set([("bam" if x.endswith(".bam") else "fastq") for x in files if x])
-    if len(file_types) > 1:
-        msg = "Found multiple file types (BAM and fastq)"
-    file_type = file_types.pop()
+    file_type = "bam" if files[0].endswith(".bam") else "fastq"
+    for fname in files[1:]:
+        if ("bam" if fname.endswith(".bam") else "fastq") != file_type:
+            msg = "Found multiple file types (BAM and fastq)"
+            break
     if file_type == "bam":
         if len(files) != 1:
             msg = "Expect a single BAM file input as input"
@@ -860,22 +1062,39 @@ def _sanity_check_files(item, files):
     if msg:
         raise ValueError("%s for %s: %s" % (msg, item.get("description", ""), files))
 
-def validate_yaml(yaml_in, yaml_fn):
-    """Check with yamllint the yaml syntaxes
-    Looking for duplicate keys."""
+# skip the linting pass for very large inputs, where re-tokenizing the
+# file roughly doubles configuration load time
+_YAMLLINT_MAX_SIZE = 1024 * 1024
+
+@functools.lru_cache(maxsize=1)
+def _yamllint_setup():
+    """Import yamllint and parse the lint configuration once per process.
+    """
     try:
         import yamllint.linter as linter
         from yamllint.config import YamlLintConfig
     except ImportError:
-        return
+        return None, None
     conf = """{"extends": "relaxed",
                "rules": {"trailing-spaces": {"level": "warning"},
                          "new-lines": {"level": "warning"},
                          "new-line-at-end-of-file": {"level": "warning"}}}"""
+    return linter, YamlLintConfig(conf)
+
+def validate_yaml(yaml_in, yaml_fn):
+    """Check with yamllint the yaml syntaxes
+    Looking for duplicate keys."""
+    linter, lint_config = _yamllint_setup()
+    if linter is None:
+        return
     if utils.file_exists(yaml_in):
+        if os.path.getsize(yaml_in) > _YAMLLINT_MAX_SIZE:
+            return
         with open(yaml_in) as in_handle:
             yaml_in = in_handle.read()
-    out = linter.run(yaml_in, YamlLintConfig(conf))
+    elif len(yaml_in) > _YAMLLINT_MAX_SIZE:
+        return
+    out = linter.run(yaml_in, lint_config)
 
     for problem in out:
         msg = '%(fn)s:%(line)s:%(col)s: [%(level)s] %(msg)s' % {'fn': yaml_fn,
@@ -890,9 +1109,13 @@ def _run_info_from_yaml(dirs, run_info_yaml, config, sample_names=None,
                         is_cwl=False, integrations=None):
     """Read run information from a passed YAML file.
     """
-    validate_yaml(run_info_yaml, run_info_yaml)
+    if integrations is None:
+        integrations = {}
+    # read once, sharing the contents between linting and parsing
     with open(run_info_yaml) as in_handle:
-        loaded = yaml.safe_load(in_handle)
+        run_info_str = in_handle.read()
+    validate_yaml(run_info_str, run_info_yaml)
+    loaded = _yload(run_info_str)
     fc_name, fc_date = None, None
     if dirs.get("flowcell"):
         try:
@@ -904,8 +1127,9 @@ def _run_info_from_yaml(dirs, run_info_yaml, config, sample_names=None,
     resources = {}
     integration_config = {}
     if isinstance(loaded, dict):
-        global_config = copy.deepcopy(loaded)
-        del global_config["details"]
+        # shallow copy: the pops below only mutate this new top-level dict
+        # and per-item consumers copy any values they modify
+        global_config = {k: v for k, v in loaded.items() if k != "details"}
         if "fc_name" in loaded:
             fc_name = loaded["fc_name"].replace(" ", "_")
         if "fc_date" in loaded:
@@ -924,98 +1148,123 @@ def _run_info_from_yaml(dirs, run_info_yaml, config, sample_names=None,
                 config[iname] = retriever.set_cache(config[iname])
                 loaded = retriever.add_remotes(loaded, config[iname])
 
-    run_details = []
-    for i, item in enumerate(loaded):
-        item = _normalize_files(item, dirs.get("flowcell"))
-        if "lane" not in item:
-            item["lane"] = str(i + 1)
-        item["lane"] = _clean_characters(item["lane"])
-        if "description" not in item:
-            if _item_is_bam(item):
-                item["description"] = get_sample_name(item["files"][0])
-            else:
-                raise ValueError("No `description` sample name provided for input #%s" % (i + 1))
-        description = _clean_characters(item["description"])
-        item["description"] = description
-        # make names R safe if we are likely to use R downstream
-        if item["analysis"].lower() in R_DOWNSTREAM_ANALYSIS:
-            if description[0].isdigit():
-                valid = "X" + description
-                logger.info("%s is not a valid R name, converting to %s." % (description, valid))
-                item["description"] = valid
-        if "upload" not in item and not is_cwl:
-            upload = global_config.get("upload", {})
-            # Handle specifying a local directory directly in upload
-            if isinstance(upload, six.string_types):
-                upload = {"dir": upload}
-            if not upload:
-                upload["dir"] = "../final"
-            if fc_name:
-                upload["fc_name"] = fc_name
-            if fc_date:
-                upload["fc_date"] = fc_date
-            upload["run_id"] = ""
-            if upload.get("dir"):
-                upload["dir"] = _file_to_abs(upload["dir"], [dirs.get("work")], makedir=True)
-            item["upload"] = upload
-        item["algorithm"] = _replace_global_vars(item["algorithm"], global_vars)
-        item["algorithm"] = genome.abs_file_paths(item["algorithm"],
-                                                  ignore_keys=ALGORITHM_NOPATH_KEYS,
-                                                  fileonly_keys=ALGORITHM_FILEONLY_KEYS,
-                                                  do_download=all(not x for x in integrations.values()))
-        item["genome_build"] = str(item.get("genome_build", ""))
-        item["algorithm"] = _add_algorithm_defaults(item["algorithm"], item.get("analysis", ""), is_cwl)
-        item["metadata"] = add_metadata_defaults(item.get("metadata", {}))
-        item["rgnames"] = prep_rg_names(item, config, fc_name, fc_date)
-        if item.get("files"):
-            item["files"] = [genome.abs_file_paths(f, do_download=all(not x for x in integrations.values()))
-                             for f in item["files"]]
-        elif "files" in item:
-            del item["files"]
-        if item.get("vrn_file") and isinstance(item["vrn_file"], six.string_types):
-            item["vrn_file"] = genome.abs_file_paths(item["vrn_file"],
-                                                     do_download=all(not x for x in integrations.values()))
-            if os.path.isfile(item["vrn_file"]):
-                # Try to prepare in place (or use ready to go inputs)
-                try:
-                    item["vrn_file"] = vcfutils.bgzip_and_index(item["vrn_file"], config,
-                                                                remove_orig=False)
-                # In case of permission errors, fix in inputs directory
-                except IOError:
-                    inputs_dir = utils.safe_makedir(os.path.join(dirs.get("work", os.getcwd()), "inputs",
-                                                                 item["description"]))
-                    item["vrn_file"] = vcfutils.bgzip_and_index(item["vrn_file"], config,
-                                                                remove_orig=False, out_dir=inputs_dir)
-            if not tz.get_in(("metadata", "batch"), item) and tz.get_in(["algorithm", "validate"], item):
-                raise ValueError("%s: Please specify a metadata batch for variant file (vrn_file) input.\n" %
-                                 (item["description"]) +
-                                 "Batching with a standard sample provides callable regions for validation.")
-        item = _clean_metadata(item)
-        item = _clean_algorithm(item)
-        item = _organize_tools_on(item, is_cwl)
-        item = _clean_background(item)
-        # Add any global resource specifications
-        if "resources" not in item:
-            item["resources"] = {}
-        for prog, pkvs in resources.items():
-            if prog not in item["resources"]:
-                item["resources"][prog] = {}
-            if pkvs is not None:
-                for key, val in pkvs.items():
-                    item["resources"][prog][key] = val
-        for iname, ivals in integration_config.items():
-            if ivals:
-                if iname not in item:
-                    item[iname] = {}
-                for k, v in ivals.items():
-                    item[iname][k] = v
-
-        run_details.append(item)
+    # loop invariant: whether to download remote inputs, given active integrations
+    do_download = not any(integrations.values()) if integrations else True
+
+    def _prepare(indexed_item):
+        i, item = indexed_item
+        return _prepare_run_info_item(i, item, dirs, config, global_config, global_vars,
+                                      resources, integration_config, fc_name, fc_date,
+                                      is_cwl, do_download)
+    # item preparation is dominated by path normalization and bgzip/index
+    # subprocesses, so overlap the I/O across samples with threads
+    if futures and len(loaded) > 1:
+        with futures.ThreadPoolExecutor(max_workers=min(16, len(loaded))) as pool:
+            run_details = list(pool.map(_prepare, enumerate(loaded)))
+    else:
+        run_details = [_prepare(indexed_item) for indexed_item in enumerate(loaded)]
     _check_sample_config(run_details, run_info_yaml, config)
     return run_details
 
+def _prepare_run_info_item(i, item, dirs, config, global_config, global_vars,
+                           resources, integration_config, fc_name, fc_date,
+                           is_cwl, do_download):
+    """Prepare a single sample entry: naming, uploads, absolute paths, cleanup.
+
+    Split out of _run_info_from_yaml so items can be prepared concurrently;
+    the shared global configuration inputs are only read.
+    """
+    # local bindings for names resolved repeatedly below
+    abs_file_paths = genome.abs_file_paths
+    clean_characters = _clean_characters
+    bgzip_and_index = vcfutils.bgzip_and_index
+    get_in = tz.get_in
+    isfile = os.path.isfile
+    item = _normalize_files(item, dirs.get("flowcell"))
+    if "lane" not in item:
+        item["lane"] = str(i + 1)
+    item["lane"] = clean_characters(item["lane"])
+    if "description" not in item:
+        if _item_is_bam(item):
+            item["description"] = get_sample_name(item["files"][0])
+        else:
+            raise ValueError("No `description` sample name provided for input #%s" % (i + 1))
+    description = clean_characters(item["description"])
+    item["description"] = description
+    # make names R safe if we are likely to use R downstream
+    if item["analysis"].lower() in R_DOWNSTREAM_ANALYSIS:
+        if description[0].isdigit():
+            valid = "X" + description
+            logger.info("%s is not a valid R name, converting to %s." % (description, valid))
+            item["description"] = valid
+    if "upload" not in item and not is_cwl:
+        upload = global_config.get("upload", {})
+        # Handle specifying a local directory directly in upload
+        if isinstance(upload, six.string_types):
+            upload = {"dir": upload}
+        else:
+            # copy to avoid concurrent mutation of the shared global configuration
+            upload = dict(upload)
+        if not upload:
+            upload["dir"] = "../final"
+        if fc_name:
+            upload["fc_name"] = fc_name
+        if fc_date:
+            upload["fc_date"] = fc_date
+        upload["run_id"] = ""
+        if upload.get("dir"):
+            upload["dir"] = _file_to_abs(upload["dir"], [dirs.get("work")], makedir=True)
+        item["upload"] = upload
+    item["algorithm"] = _replace_global_vars(item["algorithm"], global_vars)
+    item["algorithm"] = abs_file_paths(item["algorithm"],
+                                       ignore_keys=ALGORITHM_NOPATH_KEYS,
+                                       fileonly_keys=ALGORITHM_FILEONLY_KEYS,
+                                       do_download=do_download)
+    item["genome_build"] = str(item.get("genome_build", ""))
+    item["algorithm"] = _add_algorithm_defaults(item["algorithm"], item.get("analysis", ""), is_cwl)
+    item["metadata"] = add_metadata_defaults(item.get("metadata", {}))
+    item["rgnames"] = prep_rg_names(item, config, fc_name, fc_date)
+    files = item.get("files")
+    if files:
+        item["files"] = [abs_file_paths(f, do_download=do_download)
+                         for f in files]
+    elif "files" in item:
+        del item["files"]
+    if item.get("vrn_file") and isinstance(item["vrn_file"], six.string_types):
+        item["vrn_file"] = abs_file_paths(item["vrn_file"], do_download=do_download)
+        if isfile(item["vrn_file"]):
+            # Try to prepare in place (or use ready to go inputs)
+            try:
+                item["vrn_file"] = bgzip_and_index(item["vrn_file"], config,
+                                                   remove_orig=False)
+            # In case of permission errors, fix in inputs directory
+            except IOError:
+                inputs_dir = utils.safe_makedir(os.path.join(dirs.get("work", os.getcwd()), "inputs",
+                                                             item["description"]))
+                item["vrn_file"] = bgzip_and_index(item["vrn_file"], config,
+                                                   remove_orig=False, out_dir=inputs_dir)
+        if not get_in(("metadata", "batch"), item) and get_in(["algorithm", "validate"], item):
+            raise ValueError("%s: Please specify a metadata batch for variant file (vrn_file) input.\n" %
+                             (item["description"]) +
+                             "Batching with a standard sample provides callable regions for validation.")
+    item = _clean_metadata(item)
+    item = _clean_algorithm(item)
+    item = _organize_tools_on(item, is_cwl)
+    item = _clean_background(item)
+    # Add any global resource specifications
+    item_resources = item.setdefault("resources", {})
+    for prog, pkvs in resources.items():
+        prog_resources = item_resources.setdefault(prog, {})
+        if pkvs is not None:
+            prog_resources.update(pkvs)
+    for iname, ivals in integration_config.items():
+        if ivals:
+            item.setdefault(iname, {}).update(ivals)
+
+    return item
+
 def _item_is_bam(item):
-    files = item.get("files", [])
+    files = item.get("files") or []
     return len(files) == 1 and files[0].endswith(".bam")
 
 def add_metadata_defaults(md):
@@ -1042,6 +1291,37 @@ def _get_nomap_split_targets(analysis, is_cwl):
     else:
         return 200
 
+# analysis independent defaults for _add_algorithm_defaults; mutable values
+# are copied per item on assignment so samples do not share list objects
+_ALG_DEFAULTS_BASE = {"archive": None,
+                      "tools_off": [],
+                      "tools_on": [],
+                      "qc": [],
+                      "trim_reads": False,
+                      "adapters": [],
+                      "effects": "snpeff",
+                      "quality_format": "standard",
+                      "align_split_size": None,
+                      "bam_clean": False,
+                      "nomap_split_size": 250,
+                      "coverage_interval": None,
+                      "min_allele_fraction": 10.0,
+                      "recalibrate": False,
+                      "realign": False,
+                      "ensemble": None,
+                      "exclude_regions": [],
+                      "variant_regions": None,
+                      "svcaller": [],
+                      "svvalidate": None,
+                      "svprioritize": None,
+                      "validate": None,
+                      "validate_regions": None,
+                      "vcfanno": []}
+_ALG_CONVERT_TO_LIST = frozenset(["tools_off", "tools_on", "hetcaller", "variantcaller", "svcaller",
+                                  "qc", "disambiguate", "vcfanno", "adapters", "custom_trim",
+                                  "exclude_regions"])
+_ALG_CONVERT_TO_SINGLE = frozenset(["hlacaller", "indelcaller", "validate_method"])
+
 def _add_algorithm_defaults(algorithm, analysis, is_cwl):
     """Central location specifying defaults for algorithm inputs.
 
@@ -1050,41 +1330,18 @@ def _add_algorithm_defaults(algorithm, analysis, is_cwl):
     """
     if not algorithm:
         algorithm = {}
-    defaults = {"archive": None,
-                "tools_off": [],
-                "tools_on": [],
-                "qc": [],
-                "trim_reads": False,
-                "adapters": [],
-                "effects": "snpeff",
-                "quality_format": "standard",
-                "expression_caller": ["salmon"] if analysis.lower().find("rna-seq") >= 0 else None,
-                "align_split_size": None,
-                "bam_clean": False,
-                "nomap_split_size": 250,
-                "nomap_split_targets": _get_nomap_split_targets(analysis, is_cwl),
-                "mark_duplicates": False if not algorithm.get("aligner") else True,
-                "coverage_interval": None,
-                "min_allele_fraction": 10.0,
-                "recalibrate": False,
-                "realign": False,
-                "ensemble": None,
-                "exclude_regions": [],
-                "variant_regions": None,
-                "svcaller": [],
-                "svvalidate": None,
-                "svprioritize": None,
-                "validate": None,
-                "validate_regions": None,
-                "vcfanno": []}
-    convert_to_list = set(["tools_off", "tools_on", "hetcaller", "variantcaller", "svcaller", "qc", "disambiguate",
-                           "vcfanno", "adapters", "custom_trim", "exclude_regions"])
-    convert_to_single = set(["hlacaller", "indelcaller", "validate_method"])
-    for k, v in defaults.items():
+    for k, v in _ALG_DEFAULTS_BASE.items():
         if k not in algorithm:
-            algorithm[k] = v
+            algorithm[k] = list(v) if isinstance(v, list) else v
+    # defaults depending on the analysis type or other algorithm inputs
+    if "expression_caller" not in algorithm:
+        algorithm["expression_caller"] = ["salmon"] if analysis.lower().find("rna-seq") >= 0 else None
+    if "nomap_split_targets" not in algorithm:
+        algorithm["nomap_split_targets"] = _get_nomap_split_targets(analysis, is_cwl)
+    if "mark_duplicates" not in algorithm:
+        algorithm["mark_duplicates"] = False if not algorithm.get("aligner") else True
     for k, v in algorithm.items():
-        if k in convert_to_list:
+        if k in _ALG_CONVERT_TO_LIST:
             if v and not isinstance(v, (list, tuple)) and not isinstance(v, dict):
                 algorithm[k] = [v]
             # ensure dictionary specified inputs get converted into individual lists
@@ -1097,7 +1354,7 @@ def _add_algorithm_defaults(algorithm, analysis, is_cwl):
                 algorithm[k] = new
             elif v is None:
                 algorithm[k] = []
-        elif k in convert_to_single:
+        elif k in _ALG_CONVERT_TO_SINGLE:
             if v and not isinstance(v, six.string_types):
                 if isinstance(v, (list, tuple)) and len(v) == 1:
                     algorithm[k] = v[0]
@@ -1112,23 +1369,23 @@ def _replace_global_vars(xs, global_vars):
     file specified in the `global` section. If found, replace with
     the full value.
     """
+    if not global_vars:
+        return xs
     if isinstance(xs, (list, tuple)):
-        return [_replace_global_vars(x) for x in xs]
+        return [_replace_global_vars(x, global_vars) for x in xs]
     elif isinstance(xs, dict):
-        final = {}
-        for k, v in xs.items():
-            if isinstance(v, six.string_types) and v in global_vars:
-                v = global_vars[v]
-            final[k] = v
-        return final
+        return {k: (global_vars[v] if isinstance(v, six.string_types) and v in global_vars else v)
+                for k, v in xs.items()}
     else:
         return xs
 
+_SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits)
+
 def clean_name(xs):
     final = []
     safec = "_"
     for x in xs:
-        if x not in string.ascii_letters + string.digits:
+        if x not in _SAFE_NAME_CHARS:
             if len(final) > 0 and final[-1] != safec:
                 final.append(safec)
         else: